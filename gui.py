@@ -5,35 +5,69 @@ from __future__ import annotations
 import os
 import platform
 import subprocess
+import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING, Mapping
 
-from pdf_processing import (
-    MergeConfig,
-    PageNumberingOptions,
-    RoipamOptions,
-    list_available_fonts,
-    merge_pdfs,
-    process_roipam_folder,
-)
+from gui_common import PAGE_POSITION_CHOICES as _PAGE_POSITION_CHOICES
+from gui_common import load_font_options
+
+if TYPE_CHECKING:
+    from pdf_processing import MergeConfig, PageNumberingOptions
 
 
 _IS_WSL = "microsoft" in platform.release().lower() or bool(os.environ.get("WSL_DISTRO_NAME"))
 
+_PDF_FILETYPES = (("PDF files", ("*.pdf", "*.PDF")), ("All files", "*.*"))
+
+
+def _win_to_wsl(path: str) -> str:
+    """Translate ``C:\\foo\\bar`` to ``/mnt/c/foo/bar`` lexically."""
+
+    drive = path[0].lower()
+    rest = path[2:].replace("\\", "/")
+    return f"/mnt/{drive}{rest}"
+
+
+@lru_cache(maxsize=256)
+def _wslpath_cached(path: str) -> str:
+    """Convert a Windows path to its WSL equivalent, caching the result.
+
+    The default drive mounts translate deterministically, so the common
+    case is handled in pure Python. ``wslpath`` (a fork+exec per call) is
+    only spawned when the lexical result does not exist, e.g. for custom
+    mount roots. Returns the input unchanged when conversion fails.
+    """
 
-_PAGE_POSITION_CHOICES = [
-    "Top left",
-    "Top center",
-    "Top right",
-    "Bottom left",
-    "Bottom center",
-    "Bottom right",
-]
+    candidate = _win_to_wsl(path)
+    if os.path.exists(candidate):
+        return candidate
 
+    try:
+        completed = subprocess.run(
+            ["wslpath", "-a", path],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except Exception:
+        return path
+    converted = completed.stdout.strip()
+    return converted or path
 
+
+@lru_cache(maxsize=1)
 def _initial_browse_dir() -> Path:
-    """Return a sensible starting directory for file dialogs."""
+    """Return a sensible starting directory for file dialogs.
+
+    The result is cached: the ``exists()`` probes below hit the 9P
+    filesystem under WSL and are surprisingly slow, and the answer does
+    not change within a session.
+    """
     if _IS_WSL:
         mnt_root = Path("/mnt")
         if mnt_root.exists():
@@ -68,13 +102,27 @@ class PDFMergeApp:
         self.enumerate_margin_left_var = tk.DoubleVar(value=10.0)
         self.enumerate_margin_right_var = tk.DoubleVar(value=10.0)
 
-        self._font_options = self._load_font_options()
-        default_font = "Helvetica"
-        if default_font not in self._font_options and self._font_options:
-            default_font = next(iter(self._font_options))
-        self.enumerate_font_var = tk.StringVar(value=default_font)
+        # Font discovery walks the filesystem; run it in the background so
+        # the window paints immediately. The result is only needed once
+        # the user enables page numbering.
+        self._font_options: Mapping[str, Path | None] | None = None
+        self._font_names: tuple[str, ...] = ()
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._fonts_future: Future[Mapping[str, Path | None]] = executor.submit(
+            self._load_font_options
+        )
+        executor.shutdown(wait=False)
+        self.enumerate_font_var = tk.StringVar(value="Helvetica")
 
         self._enumerate_widgets: list[tk.Widget] = []
+        self._numbering_built = False
+        self._font_combo: ttk.Combobox | None = None
+        self._open_dialog: filedialog.Open | None = None
+        self._save_dialog: filedialog.SaveAs | None = None
+        self._delete_state_after_id: str | None = None
+        self._delete_state_last_raw: tuple[str, str] | None = None
+        self._delete_state_last_seen: tuple[str, str] | None = None
+        self._parsed_path_cache: dict[str, Path] = {}
 
         self._build_layout()
 
@@ -82,6 +130,37 @@ class PDFMergeApp:
         self.output_var.trace_add("write", self._update_delete_template_state)
         self._update_delete_template_state()
 
+        self.master.after_idle(self._prewarm_dialogs)
+
+    def _prewarm_dialogs(self) -> None:
+        """Warm up the file dialog machinery so the first Browse is snappy.
+
+        The first ``filedialog`` invocation pays for native dialog
+        initialisation, and ``_initial_browse_dir`` stats the filesystem;
+        doing both once at idle time moves that cost off the click path.
+        """
+
+        try:
+            self._get_open_dialog()
+            self._get_save_dialog()
+        except tk.TclError:  # pragma: no cover - depends on platform dialogs
+            pass
+        _initial_browse_dir()
+
+    def _get_open_dialog(self) -> filedialog.Open:
+        if self._open_dialog is None:
+            self._open_dialog = filedialog.Open(self.master, filetypes=_PDF_FILETYPES)
+        return self._open_dialog
+
+    def _get_save_dialog(self) -> filedialog.SaveAs:
+        if self._save_dialog is None:
+            self._save_dialog = filedialog.SaveAs(
+                self.master,
+                defaultextension=".pdf",
+                filetypes=_PDF_FILETYPES,
+            )
+        return self._save_dialog
+
     def _build_layout(self) -> None:
         main_frame = tk.Frame(self.master, padx=10, pady=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -150,6 +229,7 @@ class PDFMergeApp:
 
         numbering_frame = tk.LabelFrame(main_frame, text="Page numbering", padx=10, pady=10)
         numbering_frame.grid(row=6, column=0, columnspan=3, pady=(10, 0), sticky="ew")
+        self._numbering_frame = numbering_frame
 
         tk.Checkbutton(
             numbering_frame,
@@ -158,26 +238,73 @@ class PDFMergeApp:
             command=self._update_enumerate_controls,
         ).grid(row=0, column=0, columnspan=4, sticky="w")
 
+        action_frame = tk.Frame(main_frame)
+        action_frame.grid(row=7, column=0, columnspan=3, pady=(15, 0))
+        self._merge_button = tk.Button(action_frame, text="Merge", command=self._on_merge)
+        self._merge_button.pack(side=tk.LEFT, padx=(0, 5))
+        tk.Button(action_frame, text="Merge ROIPAM", command=self._on_roipam_merge).pack(side=tk.LEFT)
+
+        self._progress_bar = ttk.Progressbar(main_frame, mode="indeterminate")
+        self._progress_bar.grid(row=8, column=0, columnspan=3, pady=(10, 0), sticky="ew")
+        self._progress_bar.grid_remove()
+
+        for i in range(3):
+            main_frame.columnconfigure(i, weight=1)
+
+        self._update_enumerate_controls()
+
+    def _build_numbering_panel(self) -> None:
+        """Create the page-numbering widgets on first use.
+
+        The panel holds over a dozen widgets plus a font menu spanning the
+        whole installed-font list; building it lazily keeps that cost out
+        of startup for users who never enable page numbering.
+        """
+
+        numbering_frame = self._numbering_frame
+        self._numbering_built = True
+        validate_float = (self.master.register(self._is_float), "%P")
+
         tk.Label(numbering_frame, text="Position:").grid(row=1, column=0, sticky="w", pady=(5, 0))
-        position_menu = tk.OptionMenu(
+        position_menu = ttk.Combobox(
             numbering_frame,
-            self.enumerate_position_var,
-            *_PAGE_POSITION_CHOICES,
+            textvariable=self.enumerate_position_var,
+            values=_PAGE_POSITION_CHOICES,
+            state="readonly",
+            width=14,
         )
         position_menu.grid(row=1, column=1, sticky="w", pady=(5, 0))
         self._enumerate_widgets.append(position_menu)
 
         tk.Label(numbering_frame, text="Font:").grid(row=1, column=2, sticky="w", pady=(5, 0), padx=(10, 0))
-        font_menu = tk.OptionMenu(
+        font_menu = ttk.Combobox(
             numbering_frame,
-            self.enumerate_font_var,
-            *self._font_options.keys(),
+            textvariable=self.enumerate_font_var,
+            values=self._font_names or ("Helvetica",),
+            state="readonly",
+            width=20,
         )
         font_menu.grid(row=1, column=3, sticky="w", pady=(5, 0))
         self._enumerate_widgets.append(font_menu)
+        self._font_combo = font_menu
+
+        # Fill in the real font list once background discovery finishes,
+        # without blocking the panel build.
+        if self._font_options is None:
+            self._fonts_future.add_done_callback(
+                lambda _future: self.master.after(0, self._populate_font_combo)
+            )
+        else:
+            self._populate_font_combo()
 
         tk.Label(numbering_frame, text="Size (pt):").grid(row=2, column=0, sticky="w", pady=(5, 0))
-        size_entry = tk.Entry(numbering_frame, textvariable=self.enumerate_font_size_var, width=8)
+        size_entry = tk.Entry(
+            numbering_frame,
+            textvariable=self.enumerate_font_size_var,
+            width=8,
+            validate="key",
+            validatecommand=validate_float,
+        )
         size_entry.grid(row=2, column=1, sticky="w", pady=(5, 0))
         self._enumerate_widgets.append(size_entry)
 
@@ -186,34 +313,57 @@ class PDFMergeApp:
         margin_frame.grid(row=4, column=0, columnspan=4, sticky="w")
 
         tk.Label(margin_frame, text="Top:").grid(row=0, column=0, sticky="w")
-        top_entry = tk.Entry(margin_frame, textvariable=self.enumerate_margin_top_var, width=8)
+        top_entry = tk.Entry(
+            margin_frame,
+            textvariable=self.enumerate_margin_top_var,
+            width=8,
+            validate="key",
+            validatecommand=validate_float,
+        )
         top_entry.grid(row=0, column=1, sticky="w", padx=(0, 10))
         self._enumerate_widgets.append(top_entry)
 
         tk.Label(margin_frame, text="Bottom:").grid(row=0, column=2, sticky="w")
-        bottom_entry = tk.Entry(margin_frame, textvariable=self.enumerate_margin_bottom_var, width=8)
+        bottom_entry = tk.Entry(
+            margin_frame,
+            textvariable=self.enumerate_margin_bottom_var,
+            width=8,
+            validate="key",
+            validatecommand=validate_float,
+        )
         bottom_entry.grid(row=0, column=3, sticky="w", padx=(0, 10))
         self._enumerate_widgets.append(bottom_entry)
 
         tk.Label(margin_frame, text="Left:").grid(row=1, column=0, sticky="w", pady=(5, 0))
-        left_entry = tk.Entry(margin_frame, textvariable=self.enumerate_margin_left_var, width=8)
+        left_entry = tk.Entry(
+            margin_frame,
+            textvariable=self.enumerate_margin_left_var,
+            width=8,
+            validate="key",
+            validatecommand=validate_float,
+        )
         left_entry.grid(row=1, column=1, sticky="w", padx=(0, 10), pady=(5, 0))
         self._enumerate_widgets.append(left_entry)
 
         tk.Label(margin_frame, text="Right:").grid(row=1, column=2, sticky="w", pady=(5, 0))
-        right_entry = tk.Entry(margin_frame, textvariable=self.enumerate_margin_right_var, width=8)
+        right_entry = tk.Entry(
+            margin_frame,
+            textvariable=self.enumerate_margin_right_var,
+            width=8,
+            validate="key",
+            validatecommand=validate_float,
+        )
         right_entry.grid(row=1, column=3, sticky="w", padx=(0, 10), pady=(5, 0))
         self._enumerate_widgets.append(right_entry)
 
-        action_frame = tk.Frame(main_frame)
-        action_frame.grid(row=7, column=0, columnspan=3, pady=(15, 0))
-        tk.Button(action_frame, text="Merge", command=self._on_merge).pack(side=tk.LEFT, padx=(0, 5))
-        tk.Button(action_frame, text="Merge ROIPAM", command=self._on_roipam_merge).pack(side=tk.LEFT)
-
-        for i in range(3):
-            main_frame.columnconfigure(i, weight=1)
-
-        self._update_enumerate_controls()
+        # The DoubleVars seed the entries with their defaults, but reads
+        # go through the widgets directly: Entry.get() returns a plain
+        # Python string without a Tcl variable round-trip.
+        self._size_entry = size_entry
+        self._margin_top_entry = top_entry
+        self._margin_bottom_entry = bottom_entry
+        self._margin_left_entry = left_entry
+        self._margin_right_entry = right_entry
 
     def _add_file_selector(
         self,
@@ -243,19 +393,45 @@ class PDFMergeApp:
         entry.grid(row=row, column=1, sticky="ew", padx=(5, 5))
         tk.Button(parent, text="Browse", command=command).grid(row=row, column=2)
 
-    def _load_font_options(self) -> dict[str, Path | None]:
-        fonts = list_available_fonts()
-        converted: dict[str, Path | None] = {}
-        for name, path in fonts.items():
-            if isinstance(path, str):
-                converted[name] = Path(path)
-            else:
-                converted[name] = path
+    def _load_font_options(self) -> Mapping[str, Path | None]:
+        return load_font_options()
+
+    def _ensure_fonts_loaded(self) -> None:
+        """Wait for background font discovery if it has not finished.
+
+        Blocks only when the user enables page numbering before the scan
+        completes; by then the cost is usually already hidden behind
+        think-time.
+        """
+
+        if self._font_options is not None:
+            return
+
+        self._font_options = self._fonts_future.result()
+        self._font_names = tuple(self._font_options)
+        if self.enumerate_font_var.get() not in self._font_options and self._font_options:
+            self.enumerate_font_var.set(next(iter(self._font_options)))
 
-        if not converted:
-            converted["Helvetica"] = None
+    def _populate_font_combo(self) -> None:
+        self._ensure_fonts_loaded()
+        if self._font_combo is not None:
+            self._font_combo["values"] = self._font_names
 
-        return converted
+    def _parsed_path(self, raw: str) -> Path:
+        """Parse ``raw`` into an expanded ``Path``, memoized by raw string.
+
+        The merge handler and the delete-template trace both parse the
+        same entry values repeatedly; caching keeps ``expanduser`` off the
+        typing hot path.
+        """
+
+        cached = self._parsed_path_cache.get(raw)
+        if cached is None:
+            if len(self._parsed_path_cache) > 64:
+                self._parsed_path_cache.clear()
+            cached = Path(raw).expanduser()
+            self._parsed_path_cache[raw] = cached
+        return cached
 
     def _dialog_initialdir(self) -> str:
         if self._last_dialog_dir and self._last_dialog_dir.exists():
@@ -263,19 +439,8 @@ class PDFMergeApp:
         return str(_initial_browse_dir())
 
     def _normalize_dialog_path(self, path: str) -> str:
-        if _IS_WSL and len(path) >= 2 and path[1] == ":":
-            try:
-                completed = subprocess.run(
-                    ["wslpath", "-a", path],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-            except Exception:
-                return path
-            converted = completed.stdout.strip()
-            if converted:
-                return converted
+        if _IS_WSL and path[1:2] == ":":
+            return _wslpath_cached(path)
         return path
 
     def _cache_dialog_dir(self, path: str) -> None:
@@ -284,40 +449,36 @@ class PDFMergeApp:
             directory = directory.parent
         self._last_dialog_dir = directory
 
+    def _pick_file(self, title: str, *, save: bool = False) -> str | None:
+        """Open a PDF file dialog and return the normalized selection.
+
+        The dialog objects are created once (usually during pre-warm) and
+        reused, which skips the per-call construction that the
+        ``ask*filename`` wrappers perform.
+        """
+
+        dialog = self._get_save_dialog() if save else self._get_open_dialog()
+        path = dialog.show(title=title, initialdir=self._dialog_initialdir())
+        if not path:
+            return None
+        normalized = self._normalize_dialog_path(path)
+        self._cache_dialog_dir(normalized)
+        return normalized
+
     def _select_template(self) -> None:
-        path = filedialog.askopenfilename(
-            title="Select template PDF",
-            filetypes=[("PDF files", ("*.pdf", "*.PDF")), ("All files", "*.*")],
-            initialdir=self._dialog_initialdir(),
-        )
-        if path:
-            normalized = self._normalize_dialog_path(path)
-            self._cache_dialog_dir(normalized)
+        normalized = self._pick_file("Select template PDF")
+        if normalized:
             self.template_var.set(normalized)
-            output_path = Path(normalized)
-            self.output_var.set(str(output_path))
+            self.output_var.set(normalized)
 
     def _select_input(self) -> None:
-        path = filedialog.askopenfilename(
-            title="Select input PDF",
-            filetypes=[("PDF files", ("*.pdf", "*.PDF")), ("All files", "*.*")],
-            initialdir=self._dialog_initialdir(),
-        )
-        if path:
-            normalized = self._normalize_dialog_path(path)
-            self._cache_dialog_dir(normalized)
+        normalized = self._pick_file("Select input PDF")
+        if normalized:
             self.input_var.set(normalized)
 
     def _select_output(self) -> None:
-        path = filedialog.asksaveasfilename(
-            title="Select output PDF",
-            defaultextension=".pdf",
-            filetypes=[("PDF files", ("*.pdf", "*.PDF")), ("All files", "*.*")],
-            initialdir=self._dialog_initialdir(),
-        )
-        if path:
-            normalized = self._normalize_dialog_path(path)
-            self._cache_dialog_dir(normalized)
+        normalized = self._pick_file("Select output PDF", save=True)
+        if normalized:
             self.output_var.set(normalized)
 
     def _select_roipam_folder(self) -> None:
@@ -330,16 +491,34 @@ class PDFMergeApp:
             self._cache_dialog_dir(normalized)
             self.roipam_folder_var.set(normalized)
 
+    @staticmethod
+    def _is_float(proposed: str) -> bool:
+        """Accept keystrokes that keep the entry a (partial) float."""
+
+        if proposed in ("", "-", ".", "-."):
+            return True
+        try:
+            float(proposed)
+        except ValueError:
+            return False
+        return True
+
     def _collect_page_numbering_options(self) -> PageNumberingOptions:
+        if not self._numbering_built:
+            self._build_numbering_panel()
+
         try:
-            font_size = self.enumerate_font_size_var.get()
-            top = self.enumerate_margin_top_var.get()
-            bottom = self.enumerate_margin_bottom_var.get()
-            left = self.enumerate_margin_left_var.get()
-            right = self.enumerate_margin_right_var.get()
-        except tk.TclError as exc:
+            font_size = float(self._size_entry.get())
+            top = float(self._margin_top_entry.get())
+            bottom = float(self._margin_bottom_entry.get())
+            left = float(self._margin_left_entry.get())
+            right = float(self._margin_right_entry.get())
+        except ValueError as exc:
             raise ValueError("Page numbering values must be numeric") from exc
 
+        from pdf_processing import PageNumberingOptions
+
+        self._ensure_fonts_loaded()
         font_choice = self.enumerate_font_var.get()
         font_path = self._font_options.get(font_choice)
 
@@ -355,6 +534,21 @@ class PDFMergeApp:
         )
 
     def _on_merge(self) -> None:
+        from pdf_processing import MergeConfig
+
+        # Cheap disk-existence checks come first so a mistaken click does
+        # not pay for font and margin validation.
+        template_path = self._parsed_path(self.template_var.get())
+        input_path = self._parsed_path(self.input_var.get())
+        output_path = self._parsed_path(self.output_var.get())
+
+        if not template_path.exists():
+            messagebox.showerror("Missing file", "Template file does not exist.")
+            return
+        if not input_path.exists():
+            messagebox.showerror("Missing file", "Input file does not exist.")
+            return
+
         page_numbering = None
         if self.enumerate_pages_var.get():
             try:
@@ -365,9 +559,9 @@ class PDFMergeApp:
 
         try:
             config = MergeConfig(
-                template_path=Path(self.template_var.get()).expanduser(),
-                input_path=Path(self.input_var.get()).expanduser(),
-                output_path=Path(self.output_var.get()).expanduser(),
+                template_path=template_path,
+                input_path=input_path,
+                output_path=output_path,
                 scale_percent=self.scale_var.get(),
                 remove_first_page=self.remove_cover_var.get(),
                 delete_template=self.delete_template_var.get(),
@@ -379,22 +573,37 @@ class PDFMergeApp:
             messagebox.showerror("Invalid configuration", str(exc))
             return
 
-        if not config.template_path.exists():
-            messagebox.showerror("Missing file", "Template file does not exist.")
-            return
-        if not config.input_path.exists():
-            messagebox.showerror("Missing file", "Input file does not exist.")
-            return
+        # Run the merge off the Tk main thread so the window keeps
+        # repainting; the result is marshalled back via ``after``.
+        self._merge_button.config(state=tk.DISABLED)
+        self._progress_bar.grid()
+        self._progress_bar.start()
+        threading.Thread(target=self._run_merge, args=(config,), daemon=True).start()
+
+    def _run_merge(self, config: MergeConfig) -> None:
+        from pdf_processing import merge_pdfs
 
         try:
             merge_pdfs(config)
         except Exception as exc:  # pragma: no cover - GUI feedback
-            messagebox.showerror("Merge failed", str(exc))
+            self.master.after(0, self._merge_done, config, exc)
+        else:
+            self.master.after(0, self._merge_done, config, None)
+
+    def _merge_done(self, config: MergeConfig, error: Exception | None) -> None:
+        self._progress_bar.stop()
+        self._progress_bar.grid_remove()
+        self._merge_button.config(state=tk.NORMAL)
+
+        if error is not None:
+            messagebox.showerror("Merge failed", str(error))
             return
 
         messagebox.showinfo("Success", f"PDF created at\n{config.output_path}")
 
     def _on_roipam_merge(self) -> None:
+        from pdf_processing import RoipamOptions, process_roipam_folder
+
         folder_raw = self.roipam_folder_var.get().strip()
         if not folder_raw:
             messagebox.showerror("Missing folder", "Please select a ROIPAM folder.")
@@ -452,16 +661,50 @@ class PDFMergeApp:
         messagebox.showinfo("ROIPAM merge complete", "\n".join(summary_lines))
 
     def _update_delete_template_state(self, *_) -> None:
+        # Tk fires traces even for no-op .set() calls; skip straight away
+        # when neither value actually changed.
+        raw_pair = (self.template_var.get(), self.output_var.get())
+        if raw_pair == self._delete_state_last_raw:
+            return
+        self._delete_state_last_raw = raw_pair
+
+        # Fired on every keystroke in the template/output entries; debounce
+        # so the filesystem work below runs once per editing pause instead
+        # of twice per character typed.
+        if self._delete_state_after_id is not None:
+            self.master.after_cancel(self._delete_state_after_id)
+        self._delete_state_after_id = self.master.after(
+            150, self._apply_delete_template_state
+        )
+
+    def _apply_delete_template_state(self) -> None:
+        self._delete_state_after_id = None
+
         template_raw = self.template_var.get().strip()
         output_raw = self.output_var.get().strip()
 
+        pair = (template_raw, output_raw)
+        if pair == self._delete_state_last_seen:
+            return
+        self._delete_state_last_seen = pair
+
         if template_raw and output_raw:
-            template_path = Path(template_raw).expanduser()
-            output_path = Path(output_raw).expanduser()
-            try:
-                same_file = template_path.resolve(strict=False) == output_path.resolve(strict=False)
-            except Exception:
-                same_file = str(template_path) == str(output_path)
+            # Cheap lexical comparison first; only fall back to resolving
+            # the paths when the strings differ.
+            same_file = os.path.normcase(os.path.normpath(template_raw)) == os.path.normcase(
+                os.path.normpath(output_raw)
+            )
+            if not same_file:
+                template_path = self._parsed_path(template_raw)
+                output_path = self._parsed_path(output_raw)
+                try:
+                    # One stat per path instead of resolve()'s
+                    # per-component walk.
+                    same_file = os.path.samefile(template_path, output_path)
+                except OSError:
+                    same_file = os.path.normcase(
+                        os.path.abspath(template_path)
+                    ) == os.path.normcase(os.path.abspath(output_path))
         else:
             same_file = False
 
@@ -472,15 +715,14 @@ class PDFMergeApp:
             self.delete_template_checkbutton.config(state=tk.NORMAL)
 
     def _update_enumerate_controls(self, *_: object) -> None:
-        state = tk.NORMAL if self.enumerate_pages_var.get() else tk.DISABLED
+        enabled = self.enumerate_pages_var.get()
+        if enabled and not self._numbering_built:
+            self._build_numbering_panel()
         for widget in self._enumerate_widgets:
-            widget.config(state=state)
-            if isinstance(widget, tk.OptionMenu):
-                menu = widget["menu"]
-                end_index = menu.index("end")
-                if end_index is not None:
-                    for idx in range(end_index + 1):
-                        menu.entryconfig(idx, state="normal" if state == tk.NORMAL else "disabled")
+            if isinstance(widget, ttk.Combobox):
+                widget.config(state="readonly" if enabled else "disabled")
+            else:
+                widget.config(state=tk.NORMAL if enabled else tk.DISABLED)
 
 
 def launch_gui() -> None:
@@ -0,0 +1,50 @@
+"""Helpers shared by the desktop and Windows GUI front ends."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+
+PAGE_POSITION_CHOICES: tuple[str, ...] = (
+    "Top left",
+    "Top center",
+    "Top right",
+    "Bottom left",
+    "Bottom center",
+    "Bottom right",
+)
+
+
+@lru_cache(maxsize=1)
+def load_font_options() -> Mapping[str, Path | None]:
+    """Return the available fonts with file paths normalized to ``Path``.
+
+    Font discovery walks the system font directories, which is slow; the
+    result is stable within a session so it is computed once and shared by
+    every GUI instance. The mapping is read-only so no caller can mutate
+    the shared cache; ``None`` marks a built-in base-14 font with no file
+    on disk.
+    """
+
+    # Imported lazily so that showing the window does not pay for the
+    # PyMuPDF import; discovery runs on a background thread anyway.
+    from pdf_processing import list_available_fonts
+
+    fonts = list_available_fonts()
+    converted: dict[str, Path | None] = {}
+    for name, path in fonts.items():
+        if isinstance(path, str):
+            converted[name] = Path(path)
+        else:
+            converted[name] = path
+
+    if "Helvetica" not in converted:
+        converted["Helvetica"] = None
+
+    return MappingProxyType(converted)
+
+
+__all__ = ["PAGE_POSITION_CHOICES", "load_font_options"]
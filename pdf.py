@@ -7,8 +7,6 @@ import sys
 from pathlib import Path
 from typing import Iterable
 
-from pdf_processing import MergeConfig, merge_pdfs
-
 
 def _positive_float(value: str) -> float:
     try:
@@ -61,6 +59,10 @@ def run_cli(args: argparse.Namespace) -> None:
     if not args.template or not args.input or not args.output:
         raise ValueError("Template, input and output paths are required for CLI usage")
 
+    # Imported here so that parsing errors and --help do not pay for the
+    # PyMuPDF import.
+    from pdf_processing import MergeConfig, merge_pdfs
+
     config = MergeConfig(
         template_path=Path(args.template),
         input_path=Path(args.input),
@@ -7,20 +7,31 @@ implementation.
 
 from __future__ import annotations
 
+import json
 import os
 import platform
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, List, Optional, Set, Tuple
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 import fitz  # PyMuPDF
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None  # type: ignore[assignment]
+
 
 _MM_TO_POINTS = 72.0 / 25.4
 
+# ioctl for copy-on-write file clones on Linux file systems that support
+# reflinks (btrfs, XFS); absent elsewhere.
+_FICLONE = getattr(fcntl, "FICLONE", None)
+
 _POSITION_SETTINGS = {
     "top_left": ("top", fitz.TEXT_ALIGN_LEFT),
     "top_center": ("top", fitz.TEXT_ALIGN_CENTER),
@@ -32,6 +43,17 @@ _POSITION_SETTINGS = {
 
 _FONT_EXTENSIONS = (".ttf", ".otf", ".ttc", ".otc")
 
+# Options for final output saves: garbage collection merges the duplicate
+# objects left by repeated template references and deflate keeps streams
+# compressed, shrinking both the file and any later re-read of it.
+_OUTPUT_SAVE_OPTIONS = {
+    "garbage": 4,
+    "deflate": True,
+    "deflate_images": True,
+    "deflate_fonts": True,
+    "clean": True,
+}
+
 _ALLEGATO_PATTERN: re.Pattern[str] = re.compile(r"^allegato\s+([A-Za-z0-9]+)", re.IGNORECASE)
 
 
@@ -85,11 +107,20 @@ class MergeConfig:
     append_only: bool = False
     enumerate_pages: bool = False
     page_numbering: PageNumberingOptions | None = None
+    parallel: bool = False
+    background_raster_dpi: float | None = None
+    # Optional in-memory input document. When set, the merge reads these
+    # bytes instead of input_path, which then only identifies the source
+    # in results and messages.
+    input_bytes: Optional[bytes] = None
 
     def __post_init__(self) -> None:
         if self.scale_percent <= 0:
             raise ValueError("scale_percent must be greater than zero")
 
+        if self.background_raster_dpi is not None and self.background_raster_dpi <= 0:
+            raise ValueError("background_raster_dpi must be greater than zero")
+
         if self.enumerate_pages:
             if self.page_numbering is None:
                 self.page_numbering = PageNumberingOptions()
@@ -106,6 +137,7 @@ class RoipamOptions:
     append_only: bool = False
     enumerate_pages: bool = False
     page_numbering: PageNumberingOptions | None = None
+    parallel: bool = False
 
     def __post_init__(self) -> None:
         if self.scale_percent <= 0:
@@ -136,20 +168,56 @@ def _with_template_suffix(path: Path) -> Path:
     return path.with_name(f"{path.stem}_temp{path.suffix}")
 
 
+def _cheap_copy(source: Path, destination: Path) -> None:
+    """Copy ``source`` to ``destination`` without duplicating data when possible.
+
+    On file systems with reflink support the clone shares data blocks
+    copy-on-write, so copying even a large template is instant. A hard
+    link is deliberately not used: the copy must not share an inode with
+    the original, because the merge may overwrite the original in place.
+    """
+
+    if _FICLONE is not None:
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, destination)
+            return
+        except OSError:
+            # Unsupported file system or cross-device clone; fall back to
+            # a regular copy after discarding the empty destination.
+            destination.unlink(missing_ok=True)
+
+    shutil.copy2(source, destination)
+
+
+@lru_cache(maxsize=512)
+def _resolved(path: str) -> Path:
+    """Memoized ``Path.resolve`` for repeated batch lookups."""
+
+    return Path(path).resolve(strict=False)
+
+
 def _prepare_template_copy(template_path: Path) -> Path:
     """Copy the template so the output can re-use the original file name."""
 
     suffixed_path = _with_template_suffix(template_path)
-    if template_path.resolve() == suffixed_path.resolve():
+    if _resolved(str(template_path)) == _resolved(str(suffixed_path)):
         # The template already follows the naming convention.
         return template_path
 
-    shutil.copy2(template_path, suffixed_path)
+    _cheap_copy(template_path, suffixed_path)
     return suffixed_path
 
 
 def _extract_allegato_id(path: Path) -> str | None:
-    match = _ALLEGATO_PATTERN.match(path.name)
+    name = path.name
+    # Cheap prefix check first: most files in a folder are not annexes,
+    # and a string compare filters them without starting the regex engine.
+    if name[:8].lower() != "allegato":
+        return None
+
+    match = _ALLEGATO_PATTERN.match(name)
     if not match:
         return None
     return match.group(1).strip()
@@ -159,35 +227,31 @@ def _is_roipam_annex(path: Path) -> bool:
     return bool(_extract_allegato_id(path))
 
 
-def _iter_cover_candidates(folder: Path, annex_path: Path) -> Iterator[Path]:
-    for candidate in folder.glob("*.[Pp][Dd][Ff]"):
-        if candidate == annex_path:
-            continue
-        if _is_roipam_annex(candidate):
-            continue
-        if candidate.stem.lower().endswith("_temp"):
-            continue
-        yield candidate
-
+def _find_roipam_cover(
+    candidates: Sequence[Tuple[str, Path]], allegato_id: str
+) -> Path | None:
+    """Pick a cover from ``(lowercased name, path)`` candidate pairs."""
 
-def _find_roipam_cover(folder: Path, annex_path: Path, allegato_id: str) -> Path | None:
     preferred = f" - allegato {allegato_id} - ".lower()
     fallback = f"allegato {allegato_id}".lower()
 
-    candidates = list(_iter_cover_candidates(folder, annex_path))
-
-    for candidate in candidates:
-        if preferred in candidate.name.lower():
+    fallback_match: Path | None = None
+    for name, candidate in candidates:
+        if preferred in name:
             return candidate
+        if fallback_match is None and fallback in name:
+            fallback_match = candidate
 
-    for candidate in candidates:
-        if fallback in candidate.name.lower():
-            return candidate
+    return fallback_match
 
-    return None
 
+def _duplicate_first_page_bytes(input_pdf: Path) -> bytes:
+    """Return ``input_pdf`` with its first page duplicated, as PDF bytes.
+
+    Building the document in memory avoids a temp-file write and the
+    re-parse that reading it back would cost.
+    """
 
-def _copy_with_duplicate_first_page(input_pdf: Path, destination: Path) -> None:
     source = fitz.open(str(input_pdf))
     duplicated = fitz.open()
     try:
@@ -196,34 +260,12 @@ def _copy_with_duplicate_first_page(input_pdf: Path, destination: Path) -> None:
 
         duplicated.insert_pdf(source, from_page=0, to_page=0)
         duplicated.insert_pdf(source)
-        duplicated.save(str(destination))
+        return duplicated.tobytes()
     finally:
         duplicated.close()
         source.close()
 
 
-def _ensure_template_has_multiple_pages(template_path: Path) -> Tuple[Path, Optional[Path]]:
-    """Return a template path guaranteed to contain at least two pages."""
-
-    template_doc = fitz.open(str(template_path))
-    try:
-        if len(template_doc) != 1:
-            return template_path, None
-
-        temp_path = template_path.parent / "template_one_page_temp.pdf"
-        writer = fitz.open()
-        try:
-            writer.insert_pdf(template_doc)
-            writer.insert_pdf(template_doc)
-            writer.save(str(temp_path))
-        finally:
-            writer.close()
-
-        return temp_path, temp_path
-    finally:
-        template_doc.close()
-
-
 def merge_pdfs(config: MergeConfig) -> None:
     """Merge PDFs according to the supplied configuration."""
 
@@ -233,26 +275,27 @@ def merge_pdfs(config: MergeConfig) -> None:
 
     template_path_to_use: Optional[Path] = None
     temporary_paths: List[Path] = []
-    needs_temp_copy = (
-        template_path.resolve(strict=False) == output_path.resolve(strict=False)
-    )
-
-    drop_first_template_page = False
+    try:
+        # One stat pair instead of resolve()'s per-component lstat chain.
+        needs_temp_copy = os.path.samefile(template_path, output_path)
+    except OSError:
+        # The output does not exist yet (the common case); a lexical
+        # comparison needs no syscalls at all.
+        needs_temp_copy = os.path.normcase(os.path.abspath(template_path)) == (
+            os.path.normcase(os.path.abspath(output_path))
+        )
 
     try:
+        # Both merge flavours and the numbering pass write below this
+        # directory; ensure it exists once here rather than per helper.
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
         if needs_temp_copy:
             template_path_to_use = _prepare_template_copy(template_path)
             if template_path_to_use != template_path:
                 temporary_paths.append(template_path_to_use)
         else:
             template_path_to_use = template_path
-        if not config.append_only:
-            template_path_to_use, single_page_temp = _ensure_template_has_multiple_pages(
-                template_path_to_use
-            )
-            if single_page_temp is not None:
-                temporary_paths.append(single_page_temp)
-                drop_first_template_page = True
 
         if config.append_only:
             _append_documents(
@@ -260,6 +303,7 @@ def merge_pdfs(config: MergeConfig) -> None:
                 input_path,
                 output_path,
                 remove_first_page=config.remove_first_page,
+                input_bytes=config.input_bytes,
             )
         else:
             _merge_documents(
@@ -268,7 +312,9 @@ def merge_pdfs(config: MergeConfig) -> None:
                 output_path,
                 scale=config.scale_percent / 100.0,
                 remove_first_page=config.remove_first_page,
-                drop_first_template_page=drop_first_template_page,
+                parallel=config.parallel,
+                background_raster_dpi=config.background_raster_dpi,
+                input_bytes=config.input_bytes,
             )
 
         if config.enumerate_pages and config.page_numbering is not None:
@@ -279,18 +325,84 @@ def merge_pdfs(config: MergeConfig) -> None:
             if temp_path.exists():
                 temp_path.unlink()
 
+        # MuPDF keeps decoded resources in a global store that otherwise
+        # grows across merges (ROIPAM batches process many documents in
+        # one run). Each document is read once, so the store has no reuse
+        # value after the merge; empty it to keep memory flat.
+        fitz.TOOLS.store_shrink(100)
+
         if config.delete_template and template_path.exists():
             if not needs_temp_copy:
                 template_path.unlink()
 
 
+def _merge_roipam_annex(
+    annex_path: Path,
+    cover_path: Path,
+    allegato_id: str,
+    output_path: Path,
+    options: RoipamOptions,
+) -> RoipamMergeResult:
+    """Merge one annex/cover pairing and report the outcome.
+
+    This is a module-level function (rather than part of the folder loop)
+    so that batch processing can dispatch it to worker processes; every
+    argument is picklable.
+    """
+
+    remove_first_page = options.remove_first_page
+    input_bytes: Optional[bytes] = None
+
+    try:
+        allegato_tag = allegato_id.upper()
+        if allegato_tag == "E":
+            remove_first_page = False
+        elif allegato_tag == "D":
+            # Duplicate the first page in memory; no temp file on disk.
+            input_bytes = _duplicate_first_page_bytes(annex_path)
+
+        config = MergeConfig(
+            template_path=cover_path,
+            input_path=annex_path,
+            output_path=output_path,
+            scale_percent=options.scale_percent,
+            remove_first_page=remove_first_page,
+            delete_template=False,
+            append_only=options.append_only,
+            enumerate_pages=options.enumerate_pages,
+            page_numbering=options.page_numbering,
+            input_bytes=input_bytes,
+        )
+
+        merge_pdfs(config)
+    except Exception as exc:  # pragma: no cover - guarded per-attachment
+        return RoipamMergeResult(
+            allegato_id=allegato_id,
+            input_path=annex_path,
+            template_path=cover_path,
+            output_path=output_path,
+            success=False,
+            message=str(exc),
+        )
+    else:
+        return RoipamMergeResult(
+            allegato_id=allegato_id,
+            input_path=annex_path,
+            template_path=cover_path,
+            output_path=output_path,
+            success=True,
+            message="Merged",
+        )
+
+
 def process_roipam_folder(folder: Path, options: RoipamOptions) -> List[RoipamMergeResult]:
     """Merge all ROIPAM attachments within ``folder``.
 
     The function mirrors the legacy automation script: it pairs each
     ``Allegato X`` PDF with the corresponding cover, applies special
     handling for Allegato D and E, and writes the merged output inside a
-    ``MERGED`` subdirectory. Source files are never deleted.
+    ``MERGED`` subdirectory. Source files are never deleted. With
+    ``options.parallel`` the independent merges run in worker processes.
     """
 
     if not folder.is_dir():
@@ -299,96 +411,204 @@ def process_roipam_folder(folder: Path, options: RoipamOptions) -> List[RoipamMe
     merged_dir = folder / "MERGED"
     merged_dir.mkdir(parents=True, exist_ok=True)
 
-    results: List[RoipamMergeResult] = []
-    annexes = sorted(
-        path for path in folder.glob("*.[Pp][Dd][Ff]") if _is_roipam_annex(path)
-    )
-
-    for annex_path in annexes:
+    # Resolved paths may go stale between batch runs (files get renamed
+    # or replaced); start each folder pass with a fresh cache.
+    _resolved.cache_clear()
+
+    # One directory scan classifies every PDF as annex or cover candidate
+    # instead of re-globbing the folder for each annex.
+    annexes: List[Path] = []
+    covers: List[Path] = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.lower().endswith(".pdf"):
+                continue
+            path = Path(entry.path)
+            if _is_roipam_annex(path):
+                annexes.append(path)
+            elif not path.stem.lower().endswith("_temp"):
+                covers.append(path)
+    annexes.sort()
+    covers.sort()
+    # Lowercase each cover name once; every annex lookup scans these
+    # pairs instead of re-lowercasing the whole folder per annex.
+    cover_names = [(cover.name.lower(), cover) for cover in covers]
+
+    # Pair annexes with covers up front; merges are dispatched afterwards
+    # so the pairing failures keep their place in the result order.
+    results: List[Optional[RoipamMergeResult]] = [None] * len(annexes)
+    jobs: List[Tuple[int, Path, Path, str, Path]] = []
+
+    for index, annex_path in enumerate(annexes):
         allegato_id = _extract_allegato_id(annex_path)
         if not allegato_id:
-            results.append(
-                RoipamMergeResult(
-                    allegato_id="",
-                    input_path=annex_path,
-                    template_path=annex_path,
-                    output_path=merged_dir / annex_path.name,
-                    success=False,
-                    message="Unable to extract allegato ID",
-                )
+            results[index] = RoipamMergeResult(
+                allegato_id="",
+                input_path=annex_path,
+                template_path=annex_path,
+                output_path=merged_dir / annex_path.name,
+                success=False,
+                message="Unable to extract allegato ID",
             )
             continue
 
-        cover_path = _find_roipam_cover(folder, annex_path, allegato_id)
+        cover_path = _find_roipam_cover(cover_names, allegato_id)
         if cover_path is None:
-            results.append(
-                RoipamMergeResult(
-                    allegato_id=allegato_id,
-                    input_path=annex_path,
-                    template_path=annex_path,
-                    output_path=merged_dir / annex_path.name,
-                    success=False,
-                    message="No matching cover found",
-                )
+            results[index] = RoipamMergeResult(
+                allegato_id=allegato_id,
+                input_path=annex_path,
+                template_path=annex_path,
+                output_path=merged_dir / annex_path.name,
+                success=False,
+                message="No matching cover found",
             )
             continue
 
-        output_path = merged_dir / cover_path.name
-        input_for_merge = annex_path
-        temporary_paths: List[Path] = []
-        append_only = options.append_only
-        remove_first_page = options.remove_first_page
-
-        try:
-            allegato_tag = allegato_id.upper()
-            if allegato_tag == "E":
-                remove_first_page = False
-            elif allegato_tag == "D":
-                duplicate_path = folder / f"{annex_path.stem}_roipam_temp{annex_path.suffix}"
-                _copy_with_duplicate_first_page(annex_path, duplicate_path)
-                temporary_paths.append(duplicate_path)
-                input_for_merge = duplicate_path
-
-            config = MergeConfig(
-                template_path=cover_path,
-                input_path=input_for_merge,
-                output_path=output_path,
-                scale_percent=options.scale_percent,
-                remove_first_page=remove_first_page,
-                delete_template=False,
-                append_only=append_only,
-                enumerate_pages=options.enumerate_pages,
-                page_numbering=options.page_numbering,
-            )
-
-            merge_pdfs(config)
-        except Exception as exc:  # pragma: no cover - guarded per-attachment
-            results.append(
-                RoipamMergeResult(
-                    allegato_id=allegato_id,
-                    input_path=annex_path,
-                    template_path=cover_path,
-                    output_path=output_path,
-                    success=False,
-                    message=str(exc),
+        jobs.append((index, annex_path, cover_path, allegato_id, merged_dir / cover_path.name))
+
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if options.parallel and workers > 1:
+        # Each merge touches distinct files and PyMuPDF holds the GIL for
+        # long stretches, so processes are the unit of parallelism here.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (
+                    index,
+                    executor.submit(
+                        _merge_roipam_annex,
+                        annex_path,
+                        cover_path,
+                        allegato_id,
+                        output_path,
+                        options,
+                    ),
                 )
+                for index, annex_path, cover_path, allegato_id, output_path in jobs
+            ]
+            for index, future in futures:
+                results[index] = future.result()
+    else:
+        for index, annex_path, cover_path, allegato_id, output_path in jobs:
+            results[index] = _merge_roipam_annex(
+                annex_path, cover_path, allegato_id, output_path, options
             )
+
+    return [result for result in results if result is not None]
+
+
+def _save_output(writer: fitz.Document, output_pdf: Path) -> None:
+    """Save ``writer`` to ``output_pdf`` via a sibling temp file.
+
+    Writing a fresh file and renaming it over the destination keeps the
+    previous output intact if the process dies mid-save, and the rename
+    is a single atomic operation instead of truncating allocated blocks.
+    """
+
+    temp_path = output_pdf.with_name(f"{output_pdf.stem}_temp_saving{output_pdf.suffix}")
+    try:
+        writer.save(str(temp_path), **_OUTPUT_SAVE_OPTIONS)
+        os.replace(temp_path, output_pdf)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _open_pdf_stream(path: Path) -> Tuple[fitz.Document, bytes]:
+    """Read ``path`` once and open it as an in-memory document.
+
+    Opening from bytes keeps MuPDF from seeking the file on disk while
+    pages are composed, and the returned buffer can be handed straight
+    to worker processes without reading the file a second time.
+    """
+
+    data = path.read_bytes()
+    return fitz.open("pdf", data), data
+
+
+def _compose_pages(
+    writer: fitz.Document,
+    template_doc: fitz.Document,
+    input_doc: fitz.Document,
+    page_indices: Sequence[int],
+    scale: float,
+    background_raster_dpi: float | None = None,
+) -> None:
+    """Compose ``page_indices`` of ``input_doc`` over the template background."""
+
+    last_template_rect = template_doc[-1].rect
+
+    # Template geometry is invariant across the loop; bind it to locals
+    # once instead of re-reading rect attributes per page.
+    template_width = last_template_rect.width
+    template_height = last_template_rect.height
+    last_template_index = len(template_doc) - 1
+    scaled_width = template_width * scale
+    scaled_height = template_height * scale
+
+    # When a raster DPI is requested the background loses vector fidelity
+    # but is stored as a single compressed image instead of replaying the
+    # template's full resource dictionary on every page.
+    background_pixmap = None
+    if background_raster_dpi:
+        zoom = background_raster_dpi / 72.0
+        background_pixmap = template_doc[last_template_index].get_pixmap(
+            matrix=fitz.Matrix(zoom, zoom), alpha=False
+        )
+
+    # show_pdf_page copies the rect internally, so one mutable Rect can
+    # be reused for every page instead of allocating a fresh one.
+    target_rect = fitz.Rect(0, 0, 0, 0)
+
+    for page_index in page_indices:
+        input_page = input_doc[page_index]
+        input_rect = input_page.rect
+
+        new_page = writer.new_page(width=template_width, height=template_height)
+        if background_pixmap is not None:
+            new_page.insert_image(last_template_rect, pixmap=background_pixmap)
         else:
-            results.append(
-                RoipamMergeResult(
-                    allegato_id=allegato_id,
-                    input_path=annex_path,
-                    template_path=cover_path,
-                    output_path=output_path,
-                    success=True,
-                    message="Merged",
-                )
+            new_page.show_pdf_page(
+                last_template_rect, template_doc, last_template_index
             )
-        finally:
-            for temp_path in temporary_paths:
-                temp_path.unlink(missing_ok=True)
 
-    return results
+        scale_factor = min(
+            scaled_width / input_rect.width, scaled_height / input_rect.height
+        )
+
+        new_width = input_rect.width * scale_factor
+        new_height = input_rect.height * scale_factor
+
+        x_offset = (template_width - new_width) / 2
+        y_offset = (template_height - new_height) / 2
+
+        target_rect.x0 = x_offset
+        target_rect.y0 = y_offset
+        target_rect.x1 = x_offset + new_width
+        target_rect.y1 = y_offset + new_height
+
+        new_page.show_pdf_page(target_rect, input_doc, page_index)
+
+
+def _merge_chunk(
+    template_bytes: bytes,
+    input_bytes: bytes,
+    page_indices: Sequence[int],
+    scale: float,
+    background_raster_dpi: float | None = None,
+) -> bytes:
+    """Worker for parallel merging: compose a slice of pages to PDF bytes."""
+
+    template_doc = fitz.open("pdf", template_bytes)
+    input_doc = fitz.open("pdf", input_bytes)
+    writer = fitz.open()
+    try:
+        _compose_pages(
+            writer, template_doc, input_doc, page_indices, scale, background_raster_dpi
+        )
+        return writer.tobytes()
+    finally:
+        writer.close()
+        template_doc.close()
+        input_doc.close()
 
 
 def _merge_documents(
@@ -398,60 +618,63 @@ def _merge_documents(
     *,
     scale: float,
     remove_first_page: bool,
-    drop_first_template_page: bool = False,
+    parallel: bool = False,
+    background_raster_dpi: float | None = None,
+    input_bytes: Optional[bytes] = None,
 ) -> None:
-    output_pdf.parent.mkdir(parents=True, exist_ok=True)
-
-    template_doc = fitz.open(str(template_pdf))
-    input_doc = fitz.open(str(input_pdf))
+    template_doc, template_bytes = _open_pdf_stream(template_pdf)
+    if input_bytes is None:
+        input_doc, input_bytes = _open_pdf_stream(input_pdf)
+    else:
+        input_doc = fitz.open("pdf", input_bytes)
 
     writer = fitz.open()
 
     try:
-        for page in template_doc:
-            writer.insert_pdf(template_doc, from_page=page.number, to_page=page.number)
-
-        last_template_page = template_doc[-1]
-        last_template_rect = last_template_page.rect
+        # The last template page serves as the background only and is
+        # never copied as an output page, so single-page templates need
+        # no on-disk duplication trick; any earlier pages become the
+        # prefix via a single bulk insert.
+        if len(template_doc) > 1:
+            writer.insert_pdf(template_doc, from_page=0, to_page=len(template_doc) - 2)
 
         start_page = 1 if remove_first_page and len(input_doc) > 0 else 0
-
-        for page_index in range(start_page, len(input_doc)):
-            input_page = input_doc[page_index]
-            input_rect = input_page.rect
-
-            new_page = writer.new_page(
-                width=last_template_rect.width, height=last_template_rect.height
-            )
-            new_page.show_pdf_page(
-                last_template_rect, template_doc, len(template_doc) - 1
-            )
-
-            scale_x = (last_template_rect.width / input_rect.width) * scale
-            scale_y = (last_template_rect.height / input_rect.height) * scale
-            scale_factor = min(scale_x, scale_y)
-
-            new_width = input_rect.width * scale_factor
-            new_height = input_rect.height * scale_factor
-
-            x_offset = (last_template_rect.width - new_width) / 2
-            y_offset = (last_template_rect.height - new_height) / 2
-
-            new_page.show_pdf_page(
-                fitz.Rect(
-                    x_offset,
-                    y_offset,
-                    x_offset + new_width,
-                    y_offset + new_height,
-                ),
-                input_doc,
-                page_index,
+        page_indices = range(start_page, len(input_doc))
+
+        workers = min(os.cpu_count() or 1, len(page_indices))
+        if parallel and workers > 1:
+            # Page composition is independent per page: split the range
+            # across processes, compose each slice to an in-memory PDF
+            # and concatenate the results in order.
+            chunk_size = -(-len(page_indices) // workers)
+            chunks = [
+                page_indices[offset : offset + chunk_size]
+                for offset in range(0, len(page_indices), chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [
+                    executor.submit(
+                        _merge_chunk,
+                        template_bytes,
+                        input_bytes,
+                        tuple(chunk),
+                        scale,
+                        background_raster_dpi,
+                    )
+                    for chunk in chunks
+                ]
+                for future in futures:
+                    part = fitz.open("pdf", future.result())
+                    try:
+                        writer.insert_pdf(part)
+                    finally:
+                        part.close()
+        else:
+            _compose_pages(
+                writer, template_doc, input_doc, page_indices, scale, background_raster_dpi
             )
 
-        writer.delete_page(len(template_doc) - 1)
-        if drop_first_template_page and len(writer) > 0:
-            writer.delete_page(0)
-        writer.save(str(output_pdf))
+        _save_output(writer, output_pdf)
     finally:
         writer.close()
         template_doc.close()
@@ -464,11 +687,13 @@ def _append_documents(
     output_pdf: Path,
     *,
     remove_first_page: bool,
+    input_bytes: Optional[bytes] = None,
 ) -> None:
-    output_pdf.parent.mkdir(parents=True, exist_ok=True)
-
-    template_doc = fitz.open(str(template_pdf))
-    input_doc = fitz.open(str(input_pdf))
+    template_doc, _ = _open_pdf_stream(template_pdf)
+    if input_bytes is None:
+        input_doc, input_bytes = _open_pdf_stream(input_pdf)
+    else:
+        input_doc = fitz.open("pdf", input_bytes)
 
     writer = fitz.open()
 
@@ -483,7 +708,7 @@ def _append_documents(
                 to_page=len(input_doc) - 1,
             )
 
-        writer.save(str(output_pdf))
+        _save_output(writer, output_pdf)
     finally:
         writer.close()
         template_doc.close()
@@ -491,58 +716,115 @@ def _append_documents(
 
 
 def _apply_page_numbers(output_pdf: Path, options: PageNumberingOptions) -> None:
-    """Add page numbers to ``output_pdf`` based on ``options``."""
+    """Add page numbers to ``output_pdf`` based on ``options``.
 
-    temp_path = output_pdf.with_name(f"{output_pdf.stem}_temp_enumerating{output_pdf.suffix}")
-    shutil.copy2(output_pdf, temp_path)
+    The document is modified in place with an incremental save, which
+    appends only the changed objects instead of copying the whole file
+    twice. When incremental saving is rejected (e.g. linearized files) a
+    sibling temp file plus ``os.replace`` is used instead.
+    """
 
+    document = fitz.open(str(output_pdf))
     try:
-        document = fitz.open(str(temp_path))
+        # ``position`` was validated and normalized when the options
+        # were built, so the placement settings can be resolved once
+        # here instead of per page.
+        vertical, alignment = _POSITION_SETTINGS[options.position]
+        # The font never changes between pages either; resolving it here
+        # avoids re-loading a custom font file on every page.
+        font_spec = _resolve_font_specification(options)
+        # The margin geometry only depends on the page size, so it is
+        # computed once per unique size instead of once per page.
+        layout_cache: dict[Tuple[float, float, float, float], Tuple[float, float, float, float]] = {}
+        labels = [str(index) for index in range(1, document.page_count + 1)]
+        # Validate horizontal fit against the widest label up front so a
+        # bad configuration fails before any page is touched; the check
+        # itself runs once per unique page size inside the layout cache.
+        font_obj = font_spec[2]
+        max_label_width = max(
+            (font_obj.text_length(label, options.font_size) for label in labels),
+            default=0.0,
+        )
+        for page, label in zip(document, labels):
+            _insert_page_number(
+                page,
+                label,
+                options,
+                vertical,
+                alignment,
+                font_spec,
+                max_label_width,
+                layout_cache,
+            )
+
         try:
-            for index, page in enumerate(document, start=1):
-                _insert_page_number(page, index, options)
-            document.save(str(output_pdf), incremental=False)
-        finally:
-            document.close()
+            document.save(
+                str(output_pdf),
+                incremental=True,
+                encryption=fitz.PDF_ENCRYPT_KEEP,
+            )
+        except (RuntimeError, ValueError):
+            temp_path = output_pdf.with_name(
+                f"{output_pdf.stem}_temp_enumerating{output_pdf.suffix}"
+            )
+            document.save(str(temp_path))
+            os.replace(temp_path, output_pdf)
     finally:
-        if temp_path.exists():
-            temp_path.unlink(missing_ok=True)
+        document.close()
 
 
-def _insert_page_number(page: fitz.Page, number: int, options: PageNumberingOptions) -> None:
-    vertical, alignment = _POSITION_SETTINGS[options.position]
+def _insert_page_number(
+    page: fitz.Page,
+    text: str,
+    options: PageNumberingOptions,
+    vertical: str,
+    alignment: int,
+    font_spec: Tuple[str, Optional[str], fitz.Font],
+    max_label_width: float,
+    layout_cache: dict,
+) -> None:
     rect = page.rect
+    rect_key = (rect.x0, rect.y0, rect.x1, rect.y1)
+    fontname, fontfile, font_obj = font_spec
+
+    layout = layout_cache.get(rect_key)
+    if layout is None:
+        left_edge = rect.x0 + options.margin_left_mm * _MM_TO_POINTS
+        right_edge = rect.x1 - options.margin_right_mm * _MM_TO_POINTS
+
+        available_width = right_edge - left_edge
+        if available_width <= 0:
+            raise ValueError("Margins leave no horizontal space for page numbers")
+        if max_label_width > available_width:
+            raise ValueError(
+                "Page number text does not fit within the specified margins"
+            )
 
-    left_margin = options.margin_left_mm * _MM_TO_POINTS
-    right_margin = options.margin_right_mm * _MM_TO_POINTS
-    top_margin = options.margin_top_mm * _MM_TO_POINTS
-    bottom_margin = options.margin_bottom_mm * _MM_TO_POINTS
+        # The baseline only depends on the page size too: margins, font
+        # metrics and font size are all invariant across pages.
+        if vertical == "top":
+            top_edge = rect.y0 + options.margin_top_mm * _MM_TO_POINTS
+            baseline = top_edge + font_obj.ascender * options.font_size
+        else:
+            bottom_edge = rect.y1 - options.margin_bottom_mm * _MM_TO_POINTS
+            baseline = bottom_edge + font_obj.descender * options.font_size
 
-    available_width = rect.width - left_margin - right_margin
-    if available_width <= 0:
-        raise ValueError("Margins leave no horizontal space for page numbers")
+        if baseline <= rect.y0:
+            raise ValueError("Margins leave no vertical space for page numbers")
 
-    fontname, fontfile, font_obj = _resolve_font_specification(options)
-    text = str(number)
-    text_width = font_obj.text_length(text, options.font_size)
+        layout = (left_edge, right_edge, available_width, baseline)
+        layout_cache[rect_key] = layout
 
-    if text_width > available_width:
-        raise ValueError("Page number text does not fit within the specified margins")
+    left_edge, right_edge, available_width, baseline = layout
 
     if alignment == fitz.TEXT_ALIGN_LEFT:
-        x = rect.x0 + left_margin
+        x = left_edge
     elif alignment == fitz.TEXT_ALIGN_CENTER:
-        x = rect.x0 + left_margin + (available_width - text_width) / 2
+        text_width = font_obj.text_length(text, options.font_size)
+        x = left_edge + (available_width - text_width) / 2
     else:
-        x = rect.x1 - right_margin - text_width
-
-    if vertical == "top":
-        baseline = rect.y0 + top_margin + font_obj.ascender * options.font_size
-    else:
-        baseline = rect.y1 - bottom_margin + font_obj.descender * options.font_size
-
-    if baseline <= rect.y0:
-        raise ValueError("Margins leave no vertical space for page numbers")
+        text_width = font_obj.text_length(text, options.font_size)
+        x = right_edge - text_width
 
     page.insert_text(
         (x, baseline),
@@ -553,6 +835,20 @@ def _insert_page_number(page: fitz.Page, number: int, options: PageNumberingOpti
     )
 
 
+@lru_cache(maxsize=32)
+def _cached_font(fontname: Optional[str], fontfile: Optional[str]) -> fitz.Font:
+    """Load a font once per (name, file) pair.
+
+    Parsing a custom font file is the most expensive step of the
+    numbering pass, and the same handful of fonts recurs across merges
+    in a batch run.
+    """
+
+    if fontfile:
+        return fitz.Font(fontfile=fontfile)
+    return fitz.Font(fontname=fontname)
+
+
 def _resolve_font_specification(
     options: PageNumberingOptions,
 ) -> Tuple[str, Optional[str], fitz.Font]:
@@ -560,13 +856,13 @@ def _resolve_font_specification(
         font_path = Path(options.font_file)
         sanitized = _sanitize_font_name(options.font_name or font_path.stem)
         try:
-            font_obj = fitz.Font(fontfile=str(font_path))
+            font_obj = _cached_font(None, str(font_path))
         except RuntimeError as exc:  # pragma: no cover - defensive
             raise ValueError(f"Unable to load font file: {font_path}") from exc
         return sanitized, str(font_path), font_obj
 
     fontname = options.font_name or "Helvetica"
-    font_obj = fitz.Font(fontname=fontname)
+    font_obj = _cached_font(fontname, None)
     return fontname, None, font_obj
 
 
@@ -575,7 +871,8 @@ def _sanitize_font_name(name: str) -> str:
     return cleaned or "CustomFont"
 
 
-def _font_search_directories() -> List[Path]:
+@lru_cache(maxsize=1)
+def _font_search_directories() -> Tuple[Path, ...]:
     system = platform.system().lower()
     candidates: List[Path] = []
 
@@ -599,42 +896,148 @@ def _font_search_directories() -> List[Path]:
             ]
         )
 
-    existing: List[Path] = []
-    for candidate in candidates:
-        if candidate.exists():
-            existing.append(candidate)
-    return existing
+    return tuple(candidates)
 
 
-def _iter_font_files() -> Iterator[Path]:
-    seen: Set[Path] = set()
-    for directory in _font_search_directories():
-        for suffix in _FONT_EXTENSIONS:
-            for path in directory.rglob(f"*{suffix}"):
+def _iter_font_files(directory: Path) -> Iterator[Path]:
+    """Yield font files below ``directory`` using a scandir walk.
+
+    ``os.scandir`` reuses the directory entry's cached stat information
+    and the suffix check runs on the plain entry name, so non-font files
+    (the vast majority in system font trees) are rejected without
+    constructing a ``Path`` or issuing extra syscalls.
+    """
+
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
                 try:
-                    resolved = path.resolve()
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(_FONT_EXTENSIONS) and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        yield Path(entry.path)
                 except OSError:
                     continue
-                if resolved in seen:
-                    continue
-                seen.add(resolved)
-                yield resolved
 
 
-@lru_cache(maxsize=1)
-def list_available_fonts() -> dict[str, Optional[Path]]:
-    """Return a mapping of available font names to optional file paths."""
+def _font_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME")
+    cache_root = Path(base) if base else Path.home() / ".cache"
+    return cache_root / "pdf-merge" / "fonts.json"
+
+
+def _load_font_index_cache() -> dict[str, dict]:
+    try:
+        with open(_font_cache_path(), "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return payload
+
+
+def _save_font_index_cache(payload: dict[str, dict]) -> None:
+    cache_path = _font_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+    except OSError:  # pragma: no cover - cache is best effort
+        pass
 
-    fonts: dict[str, Optional[Path]] = {name: None for name in fitz.Base14_fontnames}
 
-    for font_path in _iter_font_files():
+def _scan_font_directory(directory: Path) -> List[Tuple[str, str]]:
+    """Walk ``directory`` and return ``(display name, path)`` pairs."""
+
+    pairs: List[Tuple[str, str]] = []
+    for font_path in _iter_font_files(directory):
         try:
             font = fitz.Font(fontfile=str(font_path))
         except (RuntimeError, ValueError):
             continue
 
         display_name = font.name.strip() or font_path.stem
-        fonts.setdefault(display_name, font_path)
+        pairs.append((display_name, str(font_path)))
+    return pairs
+
+
+@lru_cache(maxsize=1)
+def list_available_fonts() -> dict[str, Optional[Path]]:
+    """Return a mapping of available font names to optional file paths.
+
+    Scanning the system font directories means opening every font file,
+    which dominates cold start. The per-directory results are therefore
+    persisted to ``~/.cache/pdf-merge/fonts.json`` keyed by the
+    directory's mtime, so warm launches skip the walk entirely.
+    """
+
+    fonts: dict[str, Optional[Path]] = {name: None for name in fitz.Base14_fontnames}
+
+    cache = _load_font_index_cache()
+    updated = False
+    index: dict[str, dict] = {}
+    pairs_by_key: dict[str, List[Tuple[str, str]]] = {}
+    to_scan: List[Tuple[str, Path]] = []
+
+    for directory in _font_search_directories():
+        key = str(directory)
+        cached = cache.get(key)
+
+        # Missing directories are cached too, so warm runs skip them
+        # without probing the tree ("caching lookup failures").
+        if (
+            isinstance(cached, dict)
+            and cached.get("exists") is False
+            and not os.path.exists(key)
+        ):
+            index[key] = {"exists": False}
+            continue
+
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except OSError:
+            index[key] = {"exists": False}
+            continue
+
+        index[key] = {"exists": True, "mtime_ns": mtime_ns}
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == mtime_ns
+            and isinstance(cached.get("fonts"), list)
+        ):
+            pairs_by_key[key] = [tuple(item) for item in cached["fonts"] if len(item) == 2]
+        else:
+            to_scan.append((key, directory))
+            updated = True
+
+    if to_scan:
+        # The walks are independent I/O, so scanning the roots in
+        # parallel costs the slowest mount rather than the sum of all of
+        # them (this matters most for /mnt/c under WSL).
+        with ThreadPoolExecutor(max_workers=len(to_scan)) as executor:
+            scanned = executor.map(_scan_font_directory, (d for _, d in to_scan))
+            for (key, _), pairs in zip(to_scan, scanned):
+                pairs_by_key[key] = pairs
+
+    for key, entry in index.items():
+        if entry.get("exists") is False:
+            continue
+        pairs = pairs_by_key.get(key, [])
+        entry["fonts"] = [list(pair) for pair in pairs]
+        for display_name, font_path in pairs:
+            fonts.setdefault(display_name, Path(font_path))
+
+    if updated or set(index) != set(cache):
+        _save_font_index_cache(index)
 
     return dict(sorted(fonts.items(), key=lambda item: item[0].lower()))
 
@@ -1,4 +1,6 @@
+import os
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -13,29 +15,63 @@ from pdf_processing import (
 )
 
 
+def _build_pdf(path: Path, contents: list[str]) -> None:
+    """Create a fixture PDF; module-level so worker processes can run it."""
+
+    doc = fitz.open()
+    try:
+        for text in contents:
+            page = doc.new_page()
+            page.insert_text((72, 72), text)
+        doc.save(str(path))
+    finally:
+        doc.close()
+
+
+def _build_pdfs(*jobs: tuple[Path, list[str]]) -> None:
+    """Build several independent fixture PDFs, in parallel when it pays.
+
+    Process startup costs more than serializing a couple of tiny
+    documents, so small fixture sets are built inline; larger (stress)
+    sets fan out across CPUs.
+    """
+
+    if len(jobs) > 2:
+        workers = min(os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_build_pdf, *zip(*jobs)))
+        return
+
+    for path, contents in jobs:
+        _build_pdf(path, contents)
+
+
 class MergeSinglePageTemplateTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The template fixture never changes and merge_pdfs copies it
+        # before mutating, so one shared build serves every test. The
+        # ROIPAM tests still get per-test directories in setUp because
+        # process_roipam_folder scans the whole folder.
+        cls._class_temp = TemporaryDirectory()
+        cls.addClassCleanup(cls._class_temp.cleanup)
+        cls.template_path = Path(cls._class_temp.name) / "template.pdf"
+        _build_pdf(cls.template_path, ["Template background"])
+
     def setUp(self) -> None:
         self._temp_dir = TemporaryDirectory()
         self.addCleanup(self._temp_dir.cleanup)
         self.base_path = Path(self._temp_dir.name)
 
     def _create_pdf(self, path: Path, contents: list[str]) -> None:
-        doc = fitz.open()
-        try:
-            for text in contents:
-                page = doc.new_page()
-                page.insert_text((72, 72), text)
-            doc.save(str(path))
-        finally:
-            doc.close()
+        _build_pdf(path, contents)
 
     def test_process_roipam_merges_into_subdirectory(self) -> None:
         base_dir = Path(self._temp_dir.name)
         cover_path = base_dir / "Project - Allegato A - cover.pdf"
         annex_path = base_dir / "Allegato A.pdf"
 
-        self._create_pdf(cover_path, ["Cover A"])
-        self._create_pdf(annex_path, ["Annex A"])
+        _build_pdfs((cover_path, ["Cover A"]), (annex_path, ["Annex A"]))
 
         options = RoipamOptions(
             scale_percent=100.0,
@@ -72,8 +108,7 @@ class MergeSinglePageTemplateTest(unittest.TestCase):
         cover_path = base_dir / "Cover Allegato D.pdf"
         annex_path = base_dir / "Allegato D.pdf"
 
-        self._create_pdf(cover_path, ["Cover D"])
-        self._create_pdf(annex_path, ["First", "Second"])
+        _build_pdfs((cover_path, ["Cover D"]), (annex_path, ["First", "Second"]))
 
         options = RoipamOptions(
             scale_percent=100.0,
@@ -106,15 +141,13 @@ class MergeSinglePageTemplateTest(unittest.TestCase):
             original_annex.close()
 
     def test_merge_drops_leading_template_page_for_single_page_template(self) -> None:
-        template_path = self.base_path / "template.pdf"
         input_path = self.base_path / "input.pdf"
         output_path = self.base_path / "output.pdf"
 
-        self._create_pdf(template_path, ["Template background"])
-        self._create_pdf(input_path, ["Page 1", "Page 2"])
+        _build_pdfs((input_path, ["Page 1", "Page 2"]))
 
         config = MergeConfig(
-            template_path=template_path,
+            template_path=self.template_path,
             input_path=input_path,
             output_path=output_path,
             remove_first_page=False,
@@ -132,12 +165,10 @@ class MergeSinglePageTemplateTest(unittest.TestCase):
             result_doc.close()
 
     def test_merge_can_add_page_numbers(self) -> None:
-        template_path = self.base_path / "template.pdf"
         input_path = self.base_path / "input.pdf"
         output_path = self.base_path / "output.pdf"
 
-        self._create_pdf(template_path, ["Template background"])
-        self._create_pdf(input_path, ["Alpha", "Beta"])
+        _build_pdfs((input_path, ["Alpha", "Beta"]))
 
         numbering = PageNumberingOptions(
             position="Bottom right",
@@ -150,7 +181,7 @@ class MergeSinglePageTemplateTest(unittest.TestCase):
         )
 
         config = MergeConfig(
-            template_path=template_path,
+            template_path=self.template_path,
             input_path=input_path,
             output_path=output_path,
             remove_first_page=False,
@@ -178,8 +209,7 @@ class MergeSinglePageTemplateTest(unittest.TestCase):
         cover_path = base_dir / "Cover Allegato E.pdf"
         annex_path = base_dir / "Allegato E.pdf"
 
-        self._create_pdf(cover_path, ["Cover E"])
-        self._create_pdf(annex_path, ["Front E", "Content E"])
+        _build_pdfs((cover_path, ["Cover E"]), (annex_path, ["Front E", "Content E"]))
 
         options = RoipamOptions(
             scale_percent=100.0,
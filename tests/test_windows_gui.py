@@ -46,6 +46,11 @@ def test_windows_gui_passes_page_numbering_to_merge(monkeypatch, tmp_path):
         monkeypatch.setattr("windows_app.gui.messagebox.showerror", lambda *args, **kwargs: None)
 
         app._on_merge()
+        # The merge runs on a worker thread; wait for it and let the
+        # completion callback scheduled via after() run before teardown.
+        if app._merge_future is not None:
+            app._merge_future.result(timeout=10)
+        root.update()
     finally:
         root.destroy()
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pdf_processing import MergeConfig
+if TYPE_CHECKING:
+    from pdf_processing import MergeConfig
 
 
 def _percentage(value: str) -> float:
@@ -21,8 +24,15 @@ def _percentage(value: str) -> float:
     return parsed
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
-    """Return an argument parser configured for the Windows launcher."""
+    """Return an argument parser configured for the Windows launcher.
+
+    The parser is built once and shared: constructing an ArgumentParser
+    registers actions and formats help text, which is wasteful to repeat
+    for callers that parse arguments more than once per process. Callers
+    that need to mutate the parser should deepcopy it first.
+    """
 
     parser = argparse.ArgumentParser(
         prog="pdf-merge",
@@ -71,6 +81,8 @@ def namespace_to_config(namespace: argparse.Namespace) -> MergeConfig:
     if not namespace.template or not namespace.input or not namespace.output:
         raise ValueError("template, input and output paths are required")
 
+    from pdf_processing import MergeConfig
+
     return MergeConfig(
         template_path=Path(namespace.template).expanduser(),
         input_path=Path(namespace.input).expanduser(),
@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Mapping, Optional
 
-from pdf_processing import (
-    MergeConfig,
-    PageNumberingOptions,
-    RoipamOptions,
-    list_available_fonts,
-    merge_pdfs,
-    process_roipam_folder,
-)
+from gui_common import PAGE_POSITION_CHOICES as _PAGE_POSITION_CHOICES
+from gui_common import load_font_options
+
+if TYPE_CHECKING:
+    from pdf_processing import MergeConfig, PageNumberingOptions
 
 try:  # pragma: no cover - tkinter availability depends on the host OS
     import tkinter as tk
@@ -22,15 +22,40 @@ except ModuleNotFoundError:  # pragma: no cover - handled at runtime
     messagebox = None
     ttk = None
 
+_PDF_FILETYPES = (("PDF files", "*.pdf"), ("All files", "*.*"))
+
+_LAZY_PDF_ATTRS = frozenset(
+    {
+        "MergeConfig",
+        "PageNumberingOptions",
+        "RoipamOptions",
+        "merge_pdfs",
+        "process_roipam_folder",
+    }
+)
+
+
+# Shared across app instances; ThreadPoolExecutor starts its worker
+# lazily on first submit, so module import stays cheap. launch_gui
+# shuts it down when the window closes.
+_MERGE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-merge")
+
 
-_PAGE_POSITION_CHOICES = [
-    "Top left",
-    "Top center",
-    "Top right",
-    "Bottom left",
-    "Bottom center",
-    "Bottom right",
-]
+def __getattr__(name: str):
+    """Resolve pdf_processing re-exports on first use (PEP 562).
+
+    Importing pdf_processing loads PyMuPDF, which the --help/argparse
+    startup path should not pay for. Resolving lazily here keeps the
+    names available as module attributes so tests can monkeypatch them.
+    """
+
+    if name in _LAZY_PDF_ATTRS:
+        import pdf_processing
+
+        value = getattr(pdf_processing, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class WindowsPDFMergeApp:
@@ -72,7 +97,30 @@ class WindowsPDFMergeApp:
                 default_font = next(iter(self._font_options))
         self.enumerate_font_var = tk.StringVar(value=default_font)
 
-        self._page_number_widgets: list[tk.Widget] = []
+        # Pre-bucketed by widget kind so state toggles need no
+        # per-widget isinstance dispatch.
+        self._numbering_comboboxes: list[ttk.Combobox] = []
+        self._numbering_entries: list[ttk.Entry] = []
+
+        # Single shared worker so merges never overlap; PyMuPDF releases
+        # the GIL for most of the work, keeping the Tk thread responsive.
+        self._merge_future: Optional[Future] = None
+
+        # Last PageNumberingOptions handed out; the write traces on the
+        # numbering variables clear it, so while it is set the variable
+        # values are unchanged and repeat Merge clicks can skip the seven
+        # Tk .get() round-trips and dataclass construction.
+        self._numbering_options_cache: Optional[PageNumberingOptions] = None
+
+        # Last directory a file dialog was confirmed in; reused as the
+        # next dialog's initialdir so Windows never re-walks a slow or
+        # stale default location.
+        self._last_dialog_dir: Optional[Path] = None
+
+        # Pending after() callbacks used to coalesce bursts of trace
+        # events (slider drags, typing in the path entries).
+        self._scale_after_id: Optional[str] = None
+        self._delete_state_after_id: Optional[str] = None
 
         self._build_layout()
         self._wire_events()
@@ -86,23 +134,24 @@ class WindowsPDFMergeApp:
         container = ttk.Frame(self.root, padding=padding)
         container.grid(column=0, row=0, sticky="nsew")
 
-        self._page_number_widgets.clear()
+        self._numbering_comboboxes.clear()
+        self._numbering_entries.clear()
 
-        self._add_file_row(
+        template_browse = self._add_file_row(
             container,
             row=0,
             label="Template PDF",
             variable=self.template_var,
             command=self._choose_template,
         )
-        self._add_file_row(
+        input_browse = self._add_file_row(
             container,
             row=1,
             label="Input PDF",
             variable=self.input_var,
             command=self._choose_input,
         )
-        self._add_file_row(
+        output_browse = self._add_file_row(
             container,
             row=2,
             label="Output PDF",
@@ -110,7 +159,7 @@ class WindowsPDFMergeApp:
             command=self._choose_output,
         )
 
-        self._add_file_row(
+        roipam_browse = self._add_file_row(
             container,
             row=3,
             label="ROIPAM folder",
@@ -162,6 +211,12 @@ class WindowsPDFMergeApp:
             command=self._update_page_numbering_state,
         ).grid(column=0, row=0, columnspan=4, sticky="w", padx=6, pady=(3, 0))
 
+        # Widgets are created in their correct initial state so no
+        # follow-up configure(state=...) pass is needed at startup.
+        numbering_enabled = self.enumerate_pages_var.get()
+        combo_state = "readonly" if numbering_enabled else "disabled"
+        entry_state = "normal" if numbering_enabled else "disabled"
+
         ttk.Label(numbering, text="Position:").grid(
             column=0, row=1, sticky="w", padx=6, pady=(6, 0)
         )
@@ -169,11 +224,11 @@ class WindowsPDFMergeApp:
             numbering,
             textvariable=self.enumerate_position_var,
             values=_PAGE_POSITION_CHOICES,
-            state="readonly",
+            state=combo_state,
             width=18,
         )
         position_combo.grid(column=1, row=1, sticky="w", padx=(0, 6), pady=(6, 0))
-        self._page_number_widgets.append(position_combo)
+        self._numbering_comboboxes.append(position_combo)
 
         ttk.Label(numbering, text="Font:").grid(
             column=2, row=1, sticky="w", padx=(6, 0), pady=(6, 0)
@@ -182,20 +237,20 @@ class WindowsPDFMergeApp:
             numbering,
             textvariable=self.enumerate_font_var,
             values=list(self._font_options.keys()),
-            state="readonly",
+            state=combo_state,
             width=18,
         )
         font_combo.grid(column=3, row=1, sticky="w", padx=(0, 6), pady=(6, 0))
-        self._page_number_widgets.append(font_combo)
+        self._numbering_comboboxes.append(font_combo)
 
         ttk.Label(numbering, text="Size (pt):").grid(
             column=0, row=2, sticky="w", padx=6, pady=(6, 0)
         )
         size_entry = ttk.Entry(
-            numbering, textvariable=self.enumerate_font_size_var, width=10
+            numbering, textvariable=self.enumerate_font_size_var, width=10, state=entry_state
         )
         size_entry.grid(column=1, row=2, sticky="w", padx=(0, 6), pady=(6, 0))
-        self._page_number_widgets.append(size_entry)
+        self._numbering_entries.append(size_entry)
 
         ttk.Label(numbering, text="Margins (mm):").grid(
             column=0, row=3, sticky="w", padx=6, pady=(6, 0)
@@ -205,43 +260,59 @@ class WindowsPDFMergeApp:
 
         ttk.Label(margin_frame, text="Top:").grid(column=0, row=0, sticky="w")
         top_entry = ttk.Entry(
-            margin_frame, textvariable=self.enumerate_margin_top_var, width=10
+            margin_frame, textvariable=self.enumerate_margin_top_var, width=10, state=entry_state
         )
         top_entry.grid(column=1, row=0, sticky="w", padx=(0, 12))
-        self._page_number_widgets.append(top_entry)
+        self._numbering_entries.append(top_entry)
 
         ttk.Label(margin_frame, text="Bottom:").grid(column=2, row=0, sticky="w")
         bottom_entry = ttk.Entry(
-            margin_frame, textvariable=self.enumerate_margin_bottom_var, width=10
+            margin_frame, textvariable=self.enumerate_margin_bottom_var, width=10, state=entry_state
         )
         bottom_entry.grid(column=3, row=0, sticky="w", padx=(0, 12))
-        self._page_number_widgets.append(bottom_entry)
+        self._numbering_entries.append(bottom_entry)
 
         ttk.Label(margin_frame, text="Left:").grid(column=0, row=1, sticky="w", pady=(6, 0))
         left_entry = ttk.Entry(
-            margin_frame, textvariable=self.enumerate_margin_left_var, width=10
+            margin_frame, textvariable=self.enumerate_margin_left_var, width=10, state=entry_state
         )
         left_entry.grid(column=1, row=1, sticky="w", padx=(0, 12), pady=(6, 0))
-        self._page_number_widgets.append(left_entry)
+        self._numbering_entries.append(left_entry)
 
         ttk.Label(margin_frame, text="Right:").grid(column=2, row=1, sticky="w", pady=(6, 0))
         right_entry = ttk.Entry(
-            margin_frame, textvariable=self.enumerate_margin_right_var, width=10
+            margin_frame, textvariable=self.enumerate_margin_right_var, width=10, state=entry_state
         )
         right_entry.grid(column=3, row=1, sticky="w", pady=(6, 0))
-        self._page_number_widgets.append(right_entry)
+        self._numbering_entries.append(right_entry)
 
         action = ttk.Frame(container)
         action.grid(column=0, row=8, columnspan=3, sticky="we", pady=(12, 0))
-        ttk.Button(action, text="Merge PDFs", command=self._on_merge).grid(
-            column=0, row=0, padx=5
-        )
-        ttk.Button(action, text="Merge ROIPAM", command=self._on_roipam_merge).grid(
-            column=1, row=0, padx=5
+        self.merge_button = ttk.Button(action, text="Merge PDFs", command=self._on_merge)
+        self.merge_button.grid(column=0, row=0, padx=5)
+        self.roipam_button = ttk.Button(
+            action, text="Merge ROIPAM", command=self._on_roipam_merge
         )
+        self.roipam_button.grid(column=1, row=0, padx=5)
+
+        # Everything that can start work or change the paths mid-merge;
+        # _on_merge disables the lot so a second click cannot race the
+        # running job on the same output file.
+        self._action_buttons = [
+            self.merge_button,
+            self.roipam_button,
+            template_browse,
+            input_browse,
+            output_browse,
+            roipam_browse,
+        ]
+
+        self.progress = ttk.Progressbar(container, mode="indeterminate")
+        self.progress.grid(column=0, row=9, columnspan=3, sticky="we", pady=(12, 0))
+        self.progress.grid_remove()
 
         status = ttk.Label(container, textvariable=self.status_var, foreground="#555555")
-        status.grid(column=0, row=9, columnspan=3, sticky="we", pady=(12, 0))
+        status.grid(column=0, row=10, columnspan=3, sticky="we", pady=(12, 0))
 
         for column in range(3):
             container.columnconfigure(column, weight=1)
@@ -249,8 +320,6 @@ class WindowsPDFMergeApp:
         numbering.columnconfigure(1, weight=1)
         numbering.columnconfigure(3, weight=1)
 
-        self._update_page_numbering_state()
-
     def _add_file_row(
         self,
         parent: ttk.Frame,
@@ -259,41 +328,56 @@ class WindowsPDFMergeApp:
         label: str,
         variable: tk.StringVar,
         command,
-    ) -> None:
+    ) -> ttk.Button:
         ttk.Label(parent, text=label).grid(column=0, row=row, sticky="w")
         entry = ttk.Entry(parent, textvariable=variable, width=50)
         entry.grid(column=1, row=row, sticky="we", padx=(6, 6))
-        ttk.Button(parent, text="Browse…", command=command).grid(column=2, row=row)
+        browse = ttk.Button(parent, text="Browse…", command=command)
+        browse.grid(column=2, row=row)
+        return browse
 
     def _wire_events(self) -> None:
         self.template_var.trace_add("write", self._update_delete_template_state)
         self.output_var.trace_add("write", self._update_delete_template_state)
         self.scale_var.trace_add("write", self._on_scale_changed)
-
-    def _load_font_options(self) -> dict[str, Path | None]:
-        fonts = list_available_fonts()
-        converted: dict[str, Path | None] = {}
-        for name, path in fonts.items():
-            if isinstance(path, str):
-                converted[name] = Path(path)
-            else:
-                converted[name] = path
-
-        if "Helvetica" not in converted:
-            converted["Helvetica"] = None
-
-        return converted
+        for variable in (
+            self.enumerate_position_var,
+            self.enumerate_font_var,
+            self.enumerate_font_size_var,
+            self.enumerate_margin_top_var,
+            self.enumerate_margin_bottom_var,
+            self.enumerate_margin_left_var,
+            self.enumerate_margin_right_var,
+        ):
+            variable.trace_add("write", self._invalidate_numbering_cache)
+
+    def _invalidate_numbering_cache(self, *_) -> None:
+        self._numbering_options_cache = None
+
+    def _load_font_options(self) -> Mapping[str, Path | None]:
+        return load_font_options()
 
     # ------------------------------------------------------------------
     # Dialog helpers
     # ------------------------------------------------------------------
+    def _dialog_initialdir(self) -> str:
+        if self._last_dialog_dir is not None and self._last_dialog_dir.exists():
+            return str(self._last_dialog_dir)
+        return str(Path.home())
+
+    def _cache_dialog_dir(self, path: Path) -> None:
+        self._last_dialog_dir = path if path.is_dir() else path.parent
+
     def _choose_template(self) -> None:
         file_path = filedialog.askopenfilename(
             title="Select template PDF",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
+            parent=self.root,
+            initialdir=self._dialog_initialdir(),
+            filetypes=_PDF_FILETYPES,
         )
         if file_path:
             path = Path(file_path).expanduser()
+            self._cache_dialog_dir(path)
             self.template_var.set(str(path))
             if not self.output_var.get().strip():
                 self.output_var.set(str(path))
@@ -302,28 +386,39 @@ class WindowsPDFMergeApp:
     def _choose_input(self) -> None:
         file_path = filedialog.askopenfilename(
             title="Select input PDF",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
+            parent=self.root,
+            initialdir=self._dialog_initialdir(),
+            filetypes=_PDF_FILETYPES,
         )
         if file_path:
             path = Path(file_path).expanduser()
+            self._cache_dialog_dir(path)
             self.input_var.set(str(path))
             self.status_var.set("Input selected. Ready to merge once output is set.")
 
     def _choose_output(self) -> None:
         file_path = filedialog.asksaveasfilename(
             title="Select output PDF",
+            parent=self.root,
+            initialdir=self._dialog_initialdir(),
             defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
+            filetypes=_PDF_FILETYPES,
         )
         if file_path:
             path = Path(file_path).expanduser()
+            self._cache_dialog_dir(path)
             self.output_var.set(str(path))
             self.status_var.set("Output file chosen. Click Merge when ready.")
 
     def _choose_roipam_folder(self) -> None:
-        folder_path = filedialog.askdirectory(title="Select ROIPAM folder")
+        folder_path = filedialog.askdirectory(
+            title="Select ROIPAM folder",
+            parent=self.root,
+            initialdir=self._dialog_initialdir(),
+        )
         if folder_path:
             path = Path(folder_path).expanduser()
+            self._cache_dialog_dir(path)
             self.roipam_folder_var.set(str(path))
             self.status_var.set("ROIPAM folder selected. Ready for batch merge.")
 
@@ -331,27 +426,53 @@ class WindowsPDFMergeApp:
     # Business logic
     # ------------------------------------------------------------------
     def _on_scale_changed(self, *_) -> None:
+        # A slider drag fires once per pixel; coalesce the redraws so the
+        # label updates at most ~30 times a second.
+        if self._scale_after_id is not None:
+            self.root.after_cancel(self._scale_after_id)
+        self._scale_after_id = self.root.after(30, self._apply_scale_display)
+
+    def _apply_scale_display(self) -> None:
+        self._scale_after_id = None
         value = int(round(float(self.scale_var.get())))
         self.scale_display_var.set(f"{value}%")
 
     def _update_page_numbering_state(self, *_) -> None:
         enabled = self.enumerate_pages_var.get()
-        for widget in self._page_number_widgets:
-            if isinstance(widget, ttk.Combobox):
-                widget.configure(state="readonly" if enabled else "disabled")
-            else:
-                widget.configure(state="normal" if enabled else "disabled")
+        combo_state = "readonly" if enabled else "disabled"
+        entry_state = "normal" if enabled else "disabled"
+        for widget in self._numbering_comboboxes:
+            widget.configure(state=combo_state)
+        for widget in self._numbering_entries:
+            widget.configure(state=entry_state)
 
     def _update_delete_template_state(self, *_) -> None:
+        if self._delete_state_after_id is not None:
+            self.root.after_cancel(self._delete_state_after_id)
+        self._delete_state_after_id = self.root.after(
+            150, self._apply_delete_template_state
+        )
+
+    def _apply_delete_template_state(self) -> None:
+        self._delete_state_after_id = None
         template = self.template_var.get().strip()
         output = self.output_var.get().strip()
 
         same = False
         if template and output:
-            try:
-                same = Path(template).expanduser().resolve(strict=False) == Path(output).expanduser().resolve(strict=False)
-            except OSError:
-                same = Path(template).expanduser() == Path(output).expanduser()
+            # Lexical comparison first: normcase/normpath needs no
+            # filesystem access, unlike resolve() which walked the
+            # symlink chain on every keystroke.
+            template_expanded = os.path.expanduser(template)
+            output_expanded = os.path.expanduser(output)
+            same = os.path.normcase(
+                os.path.normpath(template_expanded)
+            ) == os.path.normcase(os.path.normpath(output_expanded))
+            if not same:
+                try:
+                    same = os.path.samefile(template_expanded, output_expanded)
+                except OSError:
+                    same = False
 
         if same:
             self.delete_template_var.set(True)
@@ -360,33 +481,49 @@ class WindowsPDFMergeApp:
             self.delete_template_check.state(["!disabled"])
 
     def _validate(self) -> MergeConfig:
+        from pdf_processing import MergeConfig
+
+        # Each field is checked explicitly so the constructor below runs
+        # without a blanket try/except on the success path.
+        template_path = Path(self.template_var.get()).expanduser()
+        input_path = Path(self.input_var.get()).expanduser()
+        output_path = Path(self.output_var.get()).expanduser()
+
+        if not os.path.exists(template_path):
+            raise ValueError("Template file does not exist")
+        if not os.path.exists(input_path):
+            raise ValueError("Input file does not exist")
+
+        try:
+            scale_percent = float(self.scale_var.get())
+        except (tk.TclError, ValueError) as exc:
+            raise ValueError("Scale must be a number") from exc
+        if scale_percent <= 0:
+            raise ValueError("Scale must be greater than zero")
+
         enumerate_pages = self.enumerate_pages_var.get()
         page_numbering: PageNumberingOptions | None = None
         if enumerate_pages:
             page_numbering = self._collect_page_numbering_options()
 
-        try:
-            config = MergeConfig(
-                template_path=Path(self.template_var.get()).expanduser(),
-                input_path=Path(self.input_var.get()).expanduser(),
-                output_path=Path(self.output_var.get()).expanduser(),
-                scale_percent=float(self.scale_var.get()),
-                remove_first_page=self.remove_first_page_var.get(),
-                delete_template=self.delete_template_var.get(),
-                append_only=self.append_only_var.get(),
-                enumerate_pages=enumerate_pages,
-                page_numbering=page_numbering,
-            )
-        except Exception as exc:  # pragma: no cover - GUI feedback
-            raise ValueError(str(exc)) from exc
-
-        if not config.template_path.exists():
-            raise ValueError("Template file does not exist")
-        if not config.input_path.exists():
-            raise ValueError("Input file does not exist")
-        return config
+        return MergeConfig(
+            template_path=template_path,
+            input_path=input_path,
+            output_path=output_path,
+            scale_percent=scale_percent,
+            remove_first_page=self.remove_first_page_var.get(),
+            delete_template=self.delete_template_var.get(),
+            append_only=self.append_only_var.get(),
+            enumerate_pages=enumerate_pages,
+            page_numbering=page_numbering,
+        )
 
     def _collect_page_numbering_options(self) -> PageNumberingOptions:
+        if self._numbering_options_cache is not None:
+            return self._numbering_options_cache
+
+        from pdf_processing import PageNumberingOptions
+
         try:
             font_size = float(self.enumerate_font_size_var.get())
             margin_top = float(self.enumerate_margin_top_var.get())
@@ -401,7 +538,7 @@ class WindowsPDFMergeApp:
             raise ValueError("Selected font is not available")
         font_path = self._font_options.get(font_choice)
 
-        return PageNumberingOptions(
+        self._numbering_options_cache = PageNumberingOptions(
             position=self.enumerate_position_var.get(),
             font_name=font_choice,
             font_file=font_path,
@@ -411,6 +548,7 @@ class WindowsPDFMergeApp:
             margin_left_mm=margin_left,
             margin_right_mm=margin_right,
         )
+        return self._numbering_options_cache
 
     def _on_merge(self) -> None:
         try:
@@ -419,13 +557,34 @@ class WindowsPDFMergeApp:
             messagebox.showerror("Invalid configuration", str(exc))
             return
 
+        for button in self._action_buttons:
+            button.state(["disabled"])
         self.status_var.set("Merging documents…")
-        self.root.update_idletasks()
-
+        self.progress.grid()
+        self.progress.start(50)
+        # The merge runs on the worker thread so Tk keeps redrawing;
+        # completion is marshalled back onto the main loop via after().
+        self._merge_future = _MERGE_EXECUTOR.submit(self._run_merge, config)
+
+    def _run_merge(self, config: MergeConfig) -> None:
+        # Looked up on the module (not imported locally) so the lazy
+        # __getattr__ hook and test monkeypatching both take effect.
+        from windows_app import gui as _gui_module
+
+        error: Optional[Exception] = None
         try:
-            merge_pdfs(config)
+            _gui_module.merge_pdfs(config)
         except Exception as exc:  # pragma: no cover - GUI feedback
-            messagebox.showerror("Merge failed", str(exc))
+            error = exc
+        self.root.after(0, lambda: self._merge_done(config, error))
+
+    def _merge_done(self, config: MergeConfig, error: Optional[Exception]) -> None:
+        self.progress.stop()
+        self.progress.grid_remove()
+        for button in self._action_buttons:
+            button.state(["!disabled"])
+        if error is not None:
+            messagebox.showerror("Merge failed", str(error))
             self.status_var.set("Merge failed. See the error message for details.")
             return
 
@@ -433,6 +592,8 @@ class WindowsPDFMergeApp:
         self.status_var.set("Merge completed successfully.")
 
     def _on_roipam_merge(self) -> None:
+        from pdf_processing import RoipamOptions, process_roipam_folder
+
         folder_raw = self.roipam_folder_var.get().strip()
         if not folder_raw:
             messagebox.showerror("Missing folder", "Please select a ROIPAM folder.")
@@ -514,6 +675,12 @@ def launch_gui() -> None:
     except tk.TclError:  # pragma: no cover - depends on platform themes
         pass
     WindowsPDFMergeApp(root)
+
+    def _on_close() -> None:
+        _MERGE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", _on_close)
     root.mainloop()
 
 
@@ -5,12 +5,13 @@ from __future__ import annotations
 import sys
 from typing import Iterable
 
-from pdf_processing import merge_pdfs
-
 from .cli import build_parser, namespace_to_config
 
 
 def _run_cli(namespace) -> None:
+    # Deferred so --help and argument errors never load PyMuPDF.
+    from pdf_processing import merge_pdfs
+
     config = namespace_to_config(namespace)
     merge_pdfs(config)
     print(f"PDF created at: {config.output_path}")